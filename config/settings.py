@@ -25,6 +25,16 @@ class Settings:
     flask_secret_key: str
     tracker_poll_interval_seconds: int
     web_ui_port: int
+    database_read_url: str  # optional replica; empty means reads use DATABASE_URL
+    db_write_pool_size: int
+    db_write_max_overflow: int
+    db_read_pool_size: int
+    db_read_max_overflow: int
+    db_pool_recycle_seconds: int
+    db_pool_timeout_seconds: int
+    db_statement_timeout_ms: int  # 0 disables
+    tracker_isolated_process: bool  # run the tracker in a supervised child process
+    report_include_focus: bool  # add deep-work / context-switch metrics to the report prompt
 
     @classmethod
     def from_env(cls) -> "Settings":
@@ -36,6 +46,16 @@ class Settings:
         flask_secret_key = os.getenv("FLASK_SECRET_KEY", "dev-secret-change-in-production").strip()
         tracker_poll = int(os.getenv("TRACKER_POLL_INTERVAL_SECONDS", "5"))
         web_port = int(os.getenv("WEB_UI_PORT", "5050"))
+        database_read_url = os.getenv("DATABASE_READ_URL", "").strip()
+        db_write_pool_size = int(os.getenv("DB_WRITE_POOL_SIZE", "2"))
+        db_write_max_overflow = int(os.getenv("DB_WRITE_MAX_OVERFLOW", "2"))
+        db_read_pool_size = int(os.getenv("DB_READ_POOL_SIZE", "5"))
+        db_read_max_overflow = int(os.getenv("DB_READ_MAX_OVERFLOW", "5"))
+        db_pool_recycle = int(os.getenv("DB_POOL_RECYCLE_SECONDS", "1800"))
+        db_pool_timeout = int(os.getenv("DB_POOL_TIMEOUT_SECONDS", "30"))
+        db_statement_timeout = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "30000"))
+        report_include_focus = os.getenv("REPORT_INCLUDE_FOCUS", "false").strip().lower() in ("1", "true", "yes")
+        tracker_isolated = os.getenv("TRACKER_ISOLATED_PROCESS", "false").strip().lower() in ("1", "true", "yes")
 
         if not database_url:
             raise SystemExit(
@@ -50,6 +70,12 @@ class Settings:
             tracker_poll = 1
         if web_port < 1 or web_port > 65535:
             web_port = 5050
+        db_write_pool_size = max(db_write_pool_size, 1)
+        db_read_pool_size = max(db_read_pool_size, 1)
+        db_write_max_overflow = max(db_write_max_overflow, 0)
+        db_read_max_overflow = max(db_read_max_overflow, 0)
+        db_pool_timeout = max(db_pool_timeout, 1)
+        db_statement_timeout = max(db_statement_timeout, 0)
 
         return cls(
             database_url=database_url,
@@ -60,6 +86,16 @@ class Settings:
             flask_secret_key=flask_secret_key,
             tracker_poll_interval_seconds=tracker_poll,
             web_ui_port=web_port,
+            database_read_url=database_read_url,
+            db_write_pool_size=db_write_pool_size,
+            db_write_max_overflow=db_write_max_overflow,
+            db_read_pool_size=db_read_pool_size,
+            db_read_max_overflow=db_read_max_overflow,
+            db_pool_recycle_seconds=db_pool_recycle,
+            db_pool_timeout_seconds=db_pool_timeout,
+            db_statement_timeout_ms=db_statement_timeout,
+            tracker_isolated_process=tracker_isolated,
+            report_include_focus=report_include_focus,
         )
 
 
@@ -1,10 +1,11 @@
 from .models import WindowSession, DailyReport, AppSettings
-from .session import get_engine, get_session_factory, init_db
+from .session import EngineRegistry, get_engine, get_session_factory, init_db
 
 __all__ = [
     "WindowSession",
     "DailyReport",
     "AppSettings",
+    "EngineRegistry",
     "get_engine",
     "get_session_factory",
     "init_db",
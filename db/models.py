@@ -1,13 +1,19 @@
 """
 SQLAlchemy models for PostgreSQL.
 """
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 from typing import Optional
 
 from sqlalchemy import Date, DateTime, Float, String, Text, func
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
+# Queries for a time range only consider sessions starting at most this long before it, so they
+# read rows near the range through the started_at index. The tracker closes a session on every
+# window change, so a single session spanning more than a day is not expected.
+SESSION_LOOKBACK = timedelta(days=1)
+
+
 class Base(DeclarativeBase):
     pass
 
@@ -1,16 +1,103 @@
 """
-Database engine and session factory.
+Database engines and session factories.
+Writes (tracker, saved reports) and reads (web UI, report stats) use separately sized pools
+so a burst of dashboard requests cannot starve the tracker of connections.
 """
-from sqlalchemy import create_engine
+import threading
+import time
+from collections import deque
+from typing import Any, Optional
+
+from sqlalchemy import create_engine, exc
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import QueuePool
 
 from .models import Base
 
 
-def get_engine(database_url: str):
+class PoolMetrics:
+    """Checkout wait times and saturation for one pool. Thread-safe."""
+
+    def __init__(self, capacity: int, window: int = 1000):
+        self.capacity = capacity
+        self._lock = threading.Lock()
+        self._recent = deque(maxlen=window)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.peak_checked_out = 0
+
+    def record(self, wait_seconds: float, checked_out: int) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.total_wait += wait_seconds
+            self.max_wait = max(self.max_wait, wait_seconds)
+            self.peak_checked_out = max(self.peak_checked_out, checked_out)
+            self._recent.append(wait_seconds)
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self.timeouts += 1
+
+    def snapshot(self, checked_out: int) -> dict[str, Any]:
+        with self._lock:
+            recent = sorted(self._recent)
+            p95 = recent[int(0.95 * (len(recent) - 1))] if recent else 0.0
+            return {
+                "capacity": self.capacity,
+                "checked_out": checked_out,
+                "saturation": round(checked_out / self.capacity, 3) if self.capacity else 0.0,
+                "peak_checked_out": self.peak_checked_out,
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "avg_wait_ms": round(1000 * self.total_wait / self.checkouts, 3) if self.checkouts else 0.0,
+                "p95_wait_ms": round(1000 * p95, 3),
+                "max_wait_ms": round(1000 * self.max_wait, 3),
+            }
+
+
+class TimedQueuePool(QueuePool):
+    """QueuePool that measures how long each checkout waits (including connecting when the pool grows)."""
+
+    def __init__(self, creator, pool_size: int = 5, max_overflow: int = 10, **kw):
+        super().__init__(creator, pool_size=pool_size, max_overflow=max_overflow, **kw)
+        self.metrics = PoolMetrics(capacity=pool_size + max(max_overflow, 0))
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            conn = super()._do_get()
+        except exc.TimeoutError:
+            self.metrics.record_timeout()
+            raise
+        self.metrics.record(time.perf_counter() - started, self.checkedout())
+        return conn
+
+    def stats(self) -> dict[str, Any]:
+        return self.metrics.snapshot(self.checkedout())
+
+
+def get_engine(
+    database_url: str,
+    pool_size: int = 5,
+    max_overflow: int = 10,
+    pool_recycle: int = -1,
+    pool_timeout: int = 30,
+    statement_timeout_ms: int = 0,
+):
+    connect_args = {}
+    if statement_timeout_ms > 0:
+        connect_args["options"] = f"-c statement_timeout={int(statement_timeout_ms)}"
     return create_engine(
         database_url,
+        poolclass=TimedQueuePool,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_recycle=pool_recycle,
+        pool_timeout=pool_timeout,
         pool_pre_ping=True,
+        connect_args=connect_args,
         echo=False,
     )
 
@@ -22,3 +109,48 @@ def get_session_factory(engine):
 def init_db(engine) -> None:
     """Create all tables if they do not exist."""
     Base.metadata.create_all(bind=engine)
+
+
+class EngineRegistry:
+    """
+    Holds the write engine (primary) and the read engine (replica if configured, else the primary
+    with its own pool). Use write_session_factory for inserts/updates, read_session_factory for queries.
+    """
+
+    def __init__(self, write_engine, read_engine):
+        self.write_engine = write_engine
+        self.read_engine = read_engine
+        self.write_session_factory = get_session_factory(write_engine)
+        self.read_session_factory = get_session_factory(read_engine)
+
+    @classmethod
+    def from_settings(cls, settings: Any) -> "EngineRegistry":
+        common = dict(
+            pool_recycle=settings.db_pool_recycle_seconds,
+            pool_timeout=settings.db_pool_timeout_seconds,
+            statement_timeout_ms=settings.db_statement_timeout_ms,
+        )
+        write_engine = get_engine(
+            settings.database_url,
+            pool_size=settings.db_write_pool_size,
+            max_overflow=settings.db_write_max_overflow,
+            **common,
+        )
+        read_engine = get_engine(
+            settings.database_read_url or settings.database_url,
+            pool_size=settings.db_read_pool_size,
+            max_overflow=settings.db_read_max_overflow,
+            **common,
+        )
+        return cls(write_engine, read_engine)
+
+    def pool_stats(self) -> dict[str, Optional[dict[str, Any]]]:
+        def _stats(engine):
+            pool = engine.pool
+            return pool.stats() if isinstance(pool, TimedQueuePool) else None
+
+        return {"write": _stats(self.write_engine), "read": _stats(self.read_engine)}
+
+    def dispose(self) -> None:
+        self.write_engine.dispose()
+        self.read_engine.dispose()
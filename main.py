@@ -5,22 +5,38 @@ Run: python main.py
 import threading
 
 from config import settings
-from db import get_engine, get_session_factory, init_db
+from db import EngineRegistry, init_db
 from scheduler import run_daily_report_now, setup_scheduler
-from tracker import WindowTracker
+from tracker import TrackerProcess, WindowTracker
 from ui import run_tray
 from ui.web import create_app
 
 
 def main() -> None:
-    engine = get_engine(settings.database_url)
-    init_db(engine)
-    session_factory = get_session_factory(engine)
+    engines = EngineRegistry.from_settings(settings)
+    init_db(engines.write_engine)
+    session_factory = engines.write_session_factory
+    read_session_factory = engines.read_session_factory
 
-    tracker = WindowTracker(
-        session_factory=session_factory,
-        poll_interval_seconds=float(settings.tracker_poll_interval_seconds),
-    )
+    if settings.tracker_isolated_process:
+        tracker = TrackerProcess(
+            database_url=settings.database_url,
+            engine_options={
+                "pool_size": 1,
+                "max_overflow": 1,
+                "pool_recycle": settings.db_pool_recycle_seconds,
+                "pool_timeout": settings.db_pool_timeout_seconds,
+                "statement_timeout_ms": settings.db_statement_timeout_ms,
+            },
+            poll_interval_seconds=float(settings.tracker_poll_interval_seconds),
+            timezone_str=settings.timezone,
+        )
+    else:
+        tracker = WindowTracker(
+            session_factory=session_factory,
+            poll_interval_seconds=float(settings.tracker_poll_interval_seconds),
+            timezone_str=settings.timezone,
+        )
     tracker.start()  # start tracking by default
 
     scheduler = setup_scheduler(
@@ -29,6 +45,8 @@ def main() -> None:
         openai_api_key=settings.openai_api_key,
         report_time=settings.report_time,
         timezone_str=settings.timezone,
+        read_session_factory=read_session_factory,
+        include_focus=settings.report_include_focus,
     )
     scheduler.start()
 
@@ -38,14 +56,18 @@ def main() -> None:
             settings.slack_webhook_url,
             settings.openai_api_key,
             settings.timezone,
+            read_session_factory,
+            settings.report_include_focus,
         )
 
     app = create_app(
         settings=settings,
-        session_factory=session_factory,
+        session_factory=read_session_factory,
         tracker_is_running=lambda: tracker.is_running,
         toggle_tracking=lambda: (tracker.stop() if tracker.is_running else tracker.start()),
         run_report_now=run_report_now,
+        pool_stats=engines.pool_stats,
+        today_snapshot=tracker.today_snapshot,
     )
 
     def run_flask():
@@ -56,7 +78,10 @@ def main() -> None:
 
     def on_quit():
         tracker.stop()
+        if isinstance(tracker, TrackerProcess):
+            tracker.close()
         scheduler.shutdown(wait=False)
+        engines.dispose()
 
     run_tray(
         web_ui_port=settings.web_ui_port,
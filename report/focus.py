@@ -0,0 +1,150 @@
+"""
+Focus and context-switch analytics computed in one SQL statement with window functions
+(a single ordered pass over the range; stretches are built from boundary rows without a GROUP BY).
+Consecutive sessions of the same process separated by at most max_gap_seconds form a stretch
+(window title changes inside an app do not break it); stretches of at least deep_work_minutes
+are deep-work blocks. A context switch is a change of process with no longer gap than max_gap_seconds.
+"""
+from datetime import date
+from typing import Any
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+_FOCUS_SQL = text(
+    """
+    WITH bounds AS (
+        SELECT (CAST(:start AS date)::timestamp AT TIME ZONE :tz) AS range_start,
+               ((CAST(:end AS date) + 1)::timestamp AT TIME ZONE :tz) AS range_end
+    ),
+    s AS (
+        SELECT w.id, w.process_name, w.started_at, w.ended_at,
+               EXTRACT(EPOCH FROM w.ended_at - w.started_at)::float8 AS seconds,
+               LAG(w.process_name) OVER ordered AS prev_process,
+               LAG(w.ended_at) OVER ordered AS prev_ended_at,
+               LEAD(w.process_name) OVER ordered AS next_process,
+               LEAD(w.started_at) OVER ordered AS next_started_at,
+               SUM(EXTRACT(EPOCH FROM w.ended_at - w.started_at)::float8) OVER ordered AS cum_seconds
+        FROM window_sessions w, bounds b
+        WHERE w.started_at >= b.range_start
+          AND w.started_at < b.range_end
+          AND w.ended_at IS NOT NULL
+        WINDOW ordered AS (ORDER BY w.started_at, w.id ROWS UNBOUNDED PRECEDING)
+    ),
+    marked AS (
+        -- One row per session: is it a context switch, does it open and/or close a stretch
+        SELECT id, process_name, started_at, ended_at, seconds, prev_process, cum_seconds,
+               COALESCE(prev_process <> process_name
+                        AND started_at - prev_ended_at <= make_interval(secs => :max_gap), false) AS is_switch,
+               COALESCE(prev_process IS DISTINCT FROM process_name
+                        OR started_at - prev_ended_at > make_interval(secs => :max_gap), true) AS opens,
+               COALESCE(next_process IS DISTINCT FROM process_name
+                        OR next_started_at - ended_at > make_interval(secs => :max_gap), true) AS closes
+        FROM s
+    ),
+    stretches AS (
+        -- Only boundary rows survive; a closing row's stretch began at itself or at the row before it
+        SELECT process_name, started_at, ended_at, seconds
+        FROM (
+            SELECT process_name, closes, ended_at,
+                   CASE WHEN opens THEN started_at ELSE LAG(started_at) OVER boundary END AS started_at,
+                   cum_seconds - CASE WHEN opens THEN cum_seconds - seconds
+                                      ELSE LAG(cum_seconds - seconds) OVER boundary END AS seconds
+            FROM marked
+            WHERE opens OR closes
+            WINDOW boundary AS (ORDER BY started_at, id)
+        ) b
+        WHERE closes
+    )
+    SELECT
+        (SELECT COALESCE(SUM(seconds), 0) FROM marked) AS tracked_seconds,
+        (SELECT COUNT(*) FROM marked WHERE is_switch) AS switches,
+        (SELECT COALESCE(json_agg(json_build_object('hour', hour, 'switches', n) ORDER BY hour), '[]')
+         FROM (SELECT EXTRACT(HOUR FROM started_at AT TIME ZONE :tz)::int AS hour, COUNT(*) AS n
+               FROM marked WHERE is_switch GROUP BY 1) h) AS switches_by_hour,
+        (SELECT json_build_object('process_name', process_name, 'started_at', started_at,
+                                  'ended_at', ended_at, 'seconds', seconds)
+         FROM stretches ORDER BY seconds DESC LIMIT 1) AS longest_stretch,
+        (SELECT COUNT(*) FROM stretches WHERE seconds >= :deep_seconds) AS deep_work_count,
+        (SELECT COALESCE(SUM(seconds), 0) FROM stretches WHERE seconds >= :deep_seconds) AS deep_work_seconds,
+        (SELECT COALESCE(json_agg(json_build_object('process_name', process_name, 'started_at', started_at,
+                                                    'ended_at', ended_at, 'seconds', seconds)
+                                  ORDER BY started_at), '[]')
+         FROM (SELECT * FROM stretches WHERE seconds >= :deep_seconds
+               ORDER BY seconds DESC LIMIT :max_blocks) d) AS deep_work_blocks,
+        (SELECT COALESCE(json_agg(json_build_object('from', prev_process, 'to', process_name, 'count', n)
+                                  ORDER BY n DESC, prev_process, process_name), '[]')
+         FROM (SELECT prev_process, process_name, COUNT(*) AS n
+               FROM marked WHERE is_switch
+               GROUP BY prev_process, process_name
+               ORDER BY n DESC, prev_process, process_name
+               LIMIT :top_n) t) AS top_transitions
+    """
+)
+
+
+def get_focus_stats(
+    session: Session,
+    start_date: date,
+    end_date: date,
+    timezone_str: str = "UTC",
+    deep_work_minutes: int = 25,
+    max_gap_seconds: int = 60,
+    top_n: int = 10,
+    max_blocks: int = 50,
+) -> dict[str, Any]:
+    """
+    Focus metrics for sessions started between start_date and end_date (inclusive, local dates).
+    Returns {tracked_minutes, context_switches, switches_per_hour, switches_by_hour, longest_focus,
+    deep_work_blocks, deep_work_count, deep_work_minutes, top_transitions}.
+    """
+    row = session.execute(
+        _FOCUS_SQL,
+        {
+            "start": start_date,
+            "end": end_date,
+            "tz": timezone_str,
+            "max_gap": max_gap_seconds,
+            "deep_seconds": deep_work_minutes * 60,
+            "top_n": top_n,
+            "max_blocks": max_blocks,
+        },
+    ).one()
+
+    def stretch(s: dict) -> dict[str, Any]:
+        return {
+            "process_name": s["process_name"],
+            "started_at": s["started_at"],
+            "ended_at": s["ended_at"],
+            "minutes": round(float(s["seconds"]) / 60.0, 1),
+        }
+
+    tracked_hours = float(row.tracked_seconds) / 3600.0
+    return {
+        "start_date": start_date.isoformat(),
+        "end_date": end_date.isoformat(),
+        "tracked_minutes": round(float(row.tracked_seconds) / 60.0, 1),
+        "context_switches": int(row.switches),
+        "switches_per_hour": round(row.switches / tracked_hours, 1) if tracked_hours else 0.0,
+        "switches_by_hour": row.switches_by_hour,
+        "longest_focus": stretch(row.longest_stretch) if row.longest_stretch else None,
+        "deep_work_count": int(row.deep_work_count),
+        "deep_work_minutes": round(float(row.deep_work_seconds) / 60.0, 1),
+        "deep_work_blocks": [stretch(s) for s in row.deep_work_blocks],
+        "top_transitions": row.top_transitions,
+    }
+
+
+def format_focus_for_prompt(focus: dict[str, Any]) -> str:
+    """Short plain-text summary of focus metrics for the report prompt."""
+    lines = [
+        f"Deep-work blocks: {focus['deep_work_count']} totaling {focus['deep_work_minutes']} minutes",
+        f"Context switches: {focus['context_switches']} ({focus['switches_per_hour']} per tracked hour)",
+    ]
+    longest = focus.get("longest_focus")
+    if longest:
+        lines.append(f"Longest uninterrupted focus: {longest['minutes']} minutes in {longest['process_name']}")
+    if focus["top_transitions"]:
+        pairs = ", ".join(f"{t['from']} -> {t['to']} ({t['count']})" for t in focus["top_transitions"][:5])
+        lines.append(f"Most frequent app switches: {pairs}")
+    return "\n".join(lines)
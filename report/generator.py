@@ -9,6 +9,7 @@ from sqlalchemy import func, text
 from sqlalchemy.orm import Session
 
 from db.models import WindowSession
+from report.focus import format_focus_for_prompt, get_focus_stats
 
 
 def get_daily_stats(
@@ -41,12 +42,17 @@ def generate_daily_report_text(
     session_factory: Any,
     openai_api_key: str,
     timezone_str: str = "UTC",
+    include_focus: bool = False,
 ) -> str:
     """
     Load daily stats from DB, call ChatGPT to produce a short professional report, return the text.
+    With include_focus, deep-work and context-switch metrics are added to the prompt.
     """
+    focus = None
     with session_factory() as session:
         stats = get_daily_stats(session, report_date, timezone_str)
+        if stats and include_focus:
+            focus = get_focus_stats(session, report_date, report_date, timezone_str)
 
     if not stats:
         return (
@@ -58,6 +64,8 @@ def generate_daily_report_text(
     for s in stats[:30]:  # cap at 30 apps
         lines.append(f"{s['process_name']} | {s['total_minutes']}")
     table = "\n".join(lines)
+    if focus:
+        table += "\n\nFocus and context switching:\n" + format_focus_for_prompt(focus)
 
     client = OpenAI(api_key=openai_api_key)
     response = client.chat.completions.create(
@@ -0,0 +1,149 @@
+"""
+Downsampled activity timelines computed in PostgreSQL.
+Sessions are clipped to bucket boundaries in SQL so only per-bucket totals leave the database.
+"""
+from datetime import date
+from typing import Any
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from db.models import SESSION_LOOKBACK
+
+BUCKET_MINUTES = (1, 5, 15, 60)
+
+# Per-app seconds in fixed buckets for one local day. Apps outside the top :top_n by
+# daily total are folded into "Other" so the payload is bounded by buckets * (top_n + 1).
+_DAY_TIMELINE_SQL = text(
+    """
+    WITH bounds AS (
+        SELECT (CAST(:d AS date)::timestamp AT TIME ZONE :tz) AS day_start,
+               ((CAST(:d AS date) + 1)::timestamp AT TIME ZONE :tz) AS day_end
+    ),
+    day_sessions AS (
+        SELECT s.process_name,
+               GREATEST(s.started_at, b.day_start) AS started_at,
+               LEAST(s.ended_at, b.day_end) AS ended_at
+        FROM window_sessions s, bounds b
+        WHERE s.started_at >= b.day_start - CAST(:lookback AS interval)
+          AND s.started_at < b.day_end
+          AND s.ended_at > b.day_start
+    ),
+    ranked AS (
+        SELECT process_name,
+               ROW_NUMBER() OVER (
+                   ORDER BY SUM(EXTRACT(EPOCH FROM ended_at - started_at)) DESC, process_name
+               ) AS rnk
+        FROM day_sessions
+        GROUP BY process_name
+    ),
+    buckets AS (
+        SELECT g AS bucket_start, g + make_interval(mins => :bucket) AS bucket_end
+        FROM bounds b,
+             generate_series(b.day_start, b.day_end - make_interval(mins => :bucket),
+                             make_interval(mins => :bucket)) AS g
+    )
+    SELECT bk.bucket_start,
+           CASE WHEN r.rnk <= :top_n THEN ds.process_name ELSE 'Other' END AS process_name,
+           SUM(EXTRACT(EPOCH FROM LEAST(ds.ended_at, bk.bucket_end)
+                                - GREATEST(ds.started_at, bk.bucket_start))) AS seconds
+    FROM buckets bk
+    JOIN day_sessions ds
+      ON ds.started_at < bk.bucket_end AND ds.ended_at > bk.bucket_start
+    JOIN ranked r ON r.process_name = ds.process_name
+    GROUP BY bk.bucket_start, 2
+    ORDER BY bk.bucket_start, seconds DESC
+    """
+)
+
+# Tracked seconds per local day for a whole year; days without activity are returned as 0.
+# Only sessions near the year are read; each is split at local midnights (usually into a single
+# piece), aggregated per day once, and then joined to the day series on equality.
+_YEAR_HEATMAP_SQL = text(
+    """
+    WITH bounds AS (
+        SELECT (make_date(:y, 1, 1)::timestamp AT TIME ZONE :tz) AS year_start,
+               (make_date(:y + 1, 1, 1)::timestamp AT TIME ZONE :tz) AS year_end
+    ),
+    pieces AS (
+        SELECT d::date AS day,
+               EXTRACT(EPOCH FROM LEAST(s.ended_at, (d + interval '1 day') AT TIME ZONE :tz, b.year_end)
+                                - GREATEST(s.started_at, d AT TIME ZONE :tz, b.year_start)) AS seconds
+        FROM window_sessions s
+        CROSS JOIN bounds b
+        CROSS JOIN LATERAL generate_series(date_trunc('day', s.started_at AT TIME ZONE :tz),
+                                           date_trunc('day', s.ended_at AT TIME ZONE :tz),
+                                           interval '1 day') AS d
+        WHERE s.started_at >= b.year_start - CAST(:lookback AS interval)
+          AND s.started_at < b.year_end
+          AND s.ended_at > b.year_start
+    ),
+    totals AS (
+        SELECT day, SUM(seconds) AS seconds
+        FROM pieces
+        WHERE seconds > 0
+        GROUP BY day
+    )
+    SELECT days.day, COALESCE(totals.seconds, 0) AS seconds
+    FROM (
+        SELECT d::date AS day
+        FROM generate_series(make_date(:y, 1, 1), make_date(:y, 12, 31), interval '1 day') AS d
+    ) days
+    LEFT JOIN totals ON totals.day = days.day
+    ORDER BY days.day
+    """
+)
+
+
+def get_day_timeline(
+    session: Session,
+    target_date: date,
+    timezone_str: str = "UTC",
+    bucket_minutes: int = 15,
+    top_n: int = 10,
+) -> dict[str, Any]:
+    """
+    Per-app seconds in fixed buckets for the given local date. Buckets without activity are omitted.
+    Returns {date, bucket_minutes, apps, buckets: [{start, apps: {process_name: seconds}}]}.
+    """
+    if bucket_minutes not in BUCKET_MINUTES:
+        raise ValueError(f"bucket_minutes must be one of {BUCKET_MINUTES}")
+    rows = session.execute(
+        _DAY_TIMELINE_SQL,
+        {
+            "d": target_date,
+            "tz": timezone_str,
+            "bucket": bucket_minutes,
+            "top_n": top_n,
+            "lookback": SESSION_LOOKBACK,
+        },
+    ).all()
+
+    buckets: list[dict[str, Any]] = []
+    apps: dict[str, float] = {}
+    for r in rows:
+        start = r.bucket_start.isoformat()
+        if not buckets or buckets[-1]["start"] != start:
+            buckets.append({"start": start, "apps": {}})
+        seconds = round(float(r.seconds), 1)
+        buckets[-1]["apps"][r.process_name] = seconds
+        apps[r.process_name] = apps.get(r.process_name, 0.0) + seconds
+    return {
+        "date": target_date.isoformat(),
+        "bucket_minutes": bucket_minutes,
+        "apps": sorted(apps, key=apps.get, reverse=True),
+        "buckets": buckets,
+    }
+
+
+def get_year_heatmap(
+    session: Session, year: int, timezone_str: str = "UTC"
+) -> list[dict[str, Any]]:
+    """Tracked time per local day of the given year. Returns list of {date, total_minutes}."""
+    rows = session.execute(
+        _YEAR_HEATMAP_SQL, {"y": year, "tz": timezone_str, "lookback": SESSION_LOOKBACK}
+    ).all()
+    return [
+        {"date": r.day.isoformat(), "total_minutes": round(float(r.seconds) / 60.0, 1)}
+        for r in rows
+    ]
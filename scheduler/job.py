@@ -17,9 +17,12 @@ def run_daily_report_now(
     slack_webhook_url: str,
     openai_api_key: str,
     timezone_str: str,
+    read_session_factory=None,
+    include_focus: bool = False,
 ) -> tuple[bool, str]:
     """
     Generate report for today (in given timezone), send to Slack, save to daily_reports.
+    Stats are loaded through read_session_factory when given (e.g. a replica); the report is saved via session_factory.
     Returns (success: bool, message: str).
     """
     tz = ZoneInfo(timezone_str)
@@ -27,7 +30,11 @@ def run_daily_report_now(
 
     try:
         report_text = generate_daily_report_text(
-            report_date, session_factory, openai_api_key, timezone_str
+            report_date,
+            read_session_factory or session_factory,
+            openai_api_key,
+            timezone_str,
+            include_focus=include_focus,
         )
     except Exception as e:
         return False, f"Report generation failed: {e}"
@@ -62,6 +69,8 @@ def setup_scheduler(
     openai_api_key: str,
     report_time: str,
     timezone_str: str,
+    read_session_factory=None,
+    include_focus: bool = False,
 ) -> BackgroundScheduler:
     """Parse report_time (HH:MM), add daily job at that time in timezone_str. Call start() on returned scheduler."""
     hour, minute = 18, 0
@@ -82,6 +91,8 @@ def setup_scheduler(
             slack_webhook_url,
             openai_api_key,
             timezone_str,
+            read_session_factory,
+            include_focus,
         )
 
     scheduler.add_job(
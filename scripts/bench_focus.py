@@ -0,0 +1,106 @@
+"""
+Benchmark focus analytics (report/focus.py) on a large synthetic dataset.
+Generates contiguous sessions in the database with generate_series, dated at the simulation epoch
+(year 2000) and spread over --days, runs get_focus_stats over that range and deletes the rows.
+Usage: python -m scripts.bench_focus [--rows 2000000] [--days 30] [--apps 12] [--runs 3]
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import timedelta
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from dotenv import load_dotenv
+
+load_dotenv(Path(__file__).resolve().parent.parent / ".env")
+
+from sqlalchemy import text
+
+from db.session import get_engine, get_session_factory, init_db
+from report.focus import get_focus_stats
+from tracker.simulator import SIMULATION_EPOCH
+
+BENCH_PREFIX = "bench_app_"
+
+# Back-to-back sessions of equal length; the app changes every 1-40 sessions.
+_GENERATE_SQL = text(
+    """
+    INSERT INTO window_sessions (process_name, window_title, started_at, ended_at, duration_seconds)
+    SELECT :prefix || app, 'bench', :epoch + make_interval(secs => g * :step),
+           :epoch + make_interval(secs => (g + 1) * :step), :step
+    FROM (
+        SELECT g, (hashint4(g / (1 + (hashint4(g / 40) & 2147483647) % 40)) & 2147483647) % :apps AS app
+        FROM generate_series(0, :rows - 1) AS g
+    ) x
+    """
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark focus analytics on synthetic sessions.")
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--apps", type=int, default=12)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    database_url = os.getenv("DATABASE_URL")
+    if not database_url:
+        print("ERROR: Set DATABASE_URL in .env")
+        sys.exit(1)
+
+    engine = get_engine(database_url, statement_timeout_ms=0)
+    init_db(engine)
+    session_factory = get_session_factory(engine)
+    step = args.days * 86400.0 / args.rows
+    start, end = SIMULATION_EPOCH, SIMULATION_EPOCH + timedelta(days=args.days)
+    # Rows start at the epoch's time of day, so the last local date is that of the last row's start
+    last_date = (end - timedelta(seconds=step)).date()
+    in_range = {"start": start, "end": end, "prefix": BENCH_PREFIX + "%"}
+
+    print(f"Generating {args.rows:,} sessions over {args.days} days ({step:.2f} s each)...")
+    t0 = time.perf_counter()
+    with engine.begin() as conn:
+        conn.execute(
+            _GENERATE_SQL,
+            {"prefix": BENCH_PREFIX, "epoch": start, "step": step, "apps": args.apps, "rows": args.rows},
+        )
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.exec_driver_sql("ANALYZE window_sessions")
+    print(f"  generated in {time.perf_counter() - t0:.1f} s")
+
+    try:
+        timings = []
+        for _ in range(args.runs):
+            with session_factory() as session:
+                t0 = time.perf_counter()
+                focus = get_focus_stats(session, start.date(), last_date, "UTC")
+                timings.append(time.perf_counter() - t0)
+        best = min(timings)
+        print(
+            f"get_focus_stats over {args.rows:,} rows: best {best:.2f} s, "
+            f"median {sorted(timings)[len(timings) // 2]:.2f} s ({args.rows / best:,.0f} rows/s)"
+        )
+        print(
+            f"  {focus['tracked_minutes'] * 60 / (step * args.rows):.1%} of generated time covered, "
+            f"{focus['context_switches']:,} switches, {focus['deep_work_count']} deep-work blocks, "
+            f"longest focus {focus['longest_focus']['minutes'] if focus['longest_focus'] else 0} min"
+        )
+    finally:
+        with engine.begin() as conn:
+            conn.execute(
+                text(
+                    "DELETE FROM window_sessions "
+                    "WHERE started_at >= :start AND started_at < :end AND process_name LIKE :prefix"
+                ),
+                in_range,
+            )
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,266 @@
+"""
+Bulk import historical window sessions from CSV or NDJSON files (optionally gzip-compressed).
+Rows are streamed into a staging table with PostgreSQL COPY, then merged into window_sessions
+skipping duplicates on (started_at, process_name, window_title); among duplicates within the
+input, the row with the latest ended_at is kept.
+
+Expected fields: process_name, window_title (or title), started_at, ended_at; duration_seconds is
+always recomputed from the timestamps. Timestamps are ISO 8601; naive values are treated as UTC.
+
+Usage: python -m scripts.import_sessions history.csv more.ndjson.gz
+"""
+import argparse
+import csv
+import gzip
+import io
+import json
+import os
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterator, Optional, TextIO
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from dotenv import load_dotenv
+
+load_dotenv(Path(__file__).resolve().parent.parent / ".env")
+
+from db.session import get_engine, init_db
+
+PROCESS_NAME_MAX = 512
+WINDOW_TITLE_MAX = 1024
+PROGRESS_EVERY_ROWS = 100_000
+REQUIRED_COLUMNS = ("process_name", "started_at", "ended_at")
+COPY_COLUMNS = ("process_name", "window_title", "started_at", "ended_at", "duration_seconds")
+
+
+class ImportStats:
+    def __init__(self) -> None:
+        self.read = 0
+        self.rejected = 0
+        self.started = time.monotonic()
+
+    def report(self, label: str) -> None:
+        elapsed = max(time.monotonic() - self.started, 1e-9)
+        print(
+            f"{label}: {self.read} rows read, {self.rejected} rejected, "
+            f"{self.read / elapsed:,.0f} rows/s",
+            flush=True,
+        )
+
+
+def _open_text(path: Path) -> TextIO:
+    # utf-8-sig drops a leading BOM (common in spreadsheet exports) that would otherwise
+    # end up in the first CSV header name
+    if path.suffix == ".gz":
+        return gzip.open(path, "rt", encoding="utf-8-sig", newline="")
+    return open(path, "r", encoding="utf-8-sig", newline="")
+
+
+def _format_of(path: Path) -> str:
+    suffixes = [s for s in path.suffixes if s != ".gz"]
+    ext = suffixes[-1] if suffixes else ""
+    if ext in (".ndjson", ".jsonl", ".json"):
+        return "ndjson"
+    if ext == ".csv":
+        return "csv"
+    raise ValueError(f"Unsupported file type: {path.name} (expected .csv or .ndjson, optionally .gz)")
+
+
+def _check_csv_header(path: Path) -> None:
+    with _open_text(path) as f:
+        fieldnames = next(csv.reader(f), [])
+    missing = [c for c in REQUIRED_COLUMNS if c not in fieldnames]
+    if "window_title" not in fieldnames and "title" not in fieldnames:
+        missing.append("window_title (or title)")
+    if missing:
+        raise ValueError(f"{path.name}: CSV header is missing {', '.join(missing)}")
+
+
+def _iter_records(path: Path, stats: ImportStats) -> Iterator[dict]:
+    with _open_text(path) as f:
+        if _format_of(path) == "csv":
+            yield from csv.DictReader(f)
+            return
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError:
+                stats.read += 1
+                stats.rejected += 1
+
+
+def _parse_ts(value) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        ts = datetime.fromisoformat(str(value).strip().replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=timezone.utc)
+    return ts
+
+
+def _validate(record: dict) -> Optional[tuple]:
+    """Returns a COPY row tuple or None if the record is invalid."""
+    if not isinstance(record, dict):
+        return None
+    # PostgreSQL text cannot contain NUL, and one such row would abort the whole COPY
+    process_name = str(record.get("process_name") or "").replace("\x00", "").strip()
+    title = str(record.get("window_title", record.get("title")) or "").replace("\x00", "")
+    started_at = _parse_ts(record.get("started_at"))
+    ended_at = _parse_ts(record.get("ended_at"))
+    if not process_name or started_at is None or ended_at is None or ended_at < started_at:
+        return None
+    duration = (ended_at - started_at).total_seconds()
+    return (
+        process_name[:PROCESS_NAME_MAX],
+        title[:WINDOW_TITLE_MAX],
+        started_at.isoformat(),
+        ended_at.isoformat(),
+        duration,
+    )
+
+
+class _CopyStream(io.TextIOBase):
+    """File-like object feeding validated rows to COPY in CSV format without materializing the file."""
+
+    def __init__(self, rows: Iterator[tuple]):
+        self._rows = rows
+        self._buf = ""
+        self._out = io.StringIO()
+        self._writer = csv.writer(self._out, lineterminator="\n")
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> str:
+        while size < 0 or len(self._buf) < size:
+            try:
+                self._writer.writerow(next(self._rows))
+            except StopIteration:
+                break
+            self._buf += self._out.getvalue()
+            self._out.seek(0)
+            self._out.truncate()
+        if size < 0:
+            chunk, self._buf = self._buf, ""
+        else:
+            chunk, self._buf = self._buf[:size], self._buf[size:]
+        return chunk
+
+    def readline(self, size: int = -1) -> str:
+        return self.read(size)
+
+
+def _valid_rows(paths: list[Path], stats: ImportStats) -> Iterator[tuple]:
+    for path in paths:
+        for record in _iter_records(path, stats):
+            stats.read += 1
+            row = _validate(record)
+            if row is None:
+                stats.rejected += 1
+            else:
+                yield row
+            if stats.read % PROGRESS_EVERY_ROWS == 0:
+                stats.report(f"  {path.name}")
+
+
+def import_files(database_url: str, paths: list[Path]) -> int:
+    """Stream all files into window_sessions. Returns the number of rows inserted."""
+    engine = get_engine(database_url)
+    init_db(engine)
+    stats = ImportStats()
+
+    try:
+        raw = engine.raw_connection()
+        try:
+            cur = raw.cursor()
+            cur.execute(
+                """
+                CREATE TEMP TABLE import_window_sessions (
+                    process_name varchar(512) NOT NULL,
+                    window_title varchar(1024) NOT NULL,
+                    started_at timestamptz NOT NULL,
+                    ended_at timestamptz NOT NULL,
+                    duration_seconds double precision NOT NULL
+                ) ON COMMIT DROP
+                """
+            )
+            cur.copy_expert(
+                f"COPY import_window_sessions ({', '.join(COPY_COLUMNS)}) FROM STDIN "
+                "WITH (FORMAT csv, FORCE_NOT_NULL (window_title))",
+                _CopyStream(_valid_rows(paths, stats)),
+            )
+            stats.report("Copied")
+
+            # Duplicates within the files and against existing rows are resolved in the database,
+            # so memory use stays constant regardless of input size.
+            cur.execute(
+                f"""
+                INSERT INTO window_sessions ({', '.join(COPY_COLUMNS)})
+                SELECT DISTINCT ON (i.started_at, i.process_name, i.window_title) {', '.join('i.' + c for c in COPY_COLUMNS)}
+                FROM import_window_sessions i
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM window_sessions w
+                    WHERE w.started_at = i.started_at
+                      AND w.process_name = i.process_name
+                      AND w.window_title = i.window_title
+                )
+                ORDER BY i.started_at, i.process_name, i.window_title, i.ended_at DESC
+                """
+            )
+            inserted = cur.rowcount
+            raw.commit()
+        except Exception:
+            raw.rollback()
+            raise
+        finally:
+            raw.close()
+
+        # No materialized aggregates exist yet; refresh planner statistics so reports and
+        # timelines pick good plans over the newly imported range.
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            conn.exec_driver_sql("ANALYZE window_sessions")
+    finally:
+        engine.dispose()
+
+    skipped = stats.read - stats.rejected - inserted
+    print(f"Inserted {inserted} rows ({skipped} duplicates skipped, {stats.rejected} rejected).")
+    stats.report("Done")
+    return inserted
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Import historical window sessions into PostgreSQL.")
+    parser.add_argument("files", nargs="+", type=Path, help="CSV or NDJSON files, optionally .gz")
+    args = parser.parse_args()
+
+    database_url = os.getenv("DATABASE_URL")
+    if not database_url:
+        print("ERROR: Set DATABASE_URL in .env")
+        sys.exit(1)
+
+    for path in args.files:
+        if not path.is_file():
+            print(f"ERROR: File not found: {path}")
+            sys.exit(1)
+        try:
+            if _format_of(path) == "csv":
+                _check_csv_header(path)
+        except ValueError as e:
+            print(f"ERROR: {e}")
+            sys.exit(1)
+
+    import_files(database_url, args.files)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Measure tracker tick jitter under heavy in-process load, with the tracker as a thread (default mode)
+and in an isolated child process (TRACKER_ISOLATED_PROCESS=true).
+The load simulates report generation / page rendering: pure-Python CPU work in several threads
+that competes for the GIL. Jitter is how late each poll wakes up relative to its schedule.
+Usage: python -m scripts.measure_tick_jitter [--seconds 20] [--interval 0.05] [--load-threads 4]
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from dotenv import load_dotenv
+
+load_dotenv(Path(__file__).resolve().parent.parent / ".env")
+
+from db.session import get_engine, get_session_factory
+from tracker import TrackerProcess, WindowTracker
+
+
+def _busy(stop: threading.Event) -> None:
+    while not stop.is_set():
+        sum(i * i for i in range(20_000))
+
+
+def _with_load(load_threads: int, seconds: float, sample) -> dict:
+    stop = threading.Event()
+    workers = [threading.Thread(target=_busy, args=(stop,), daemon=True) for _ in range(load_threads)]
+    for w in workers:
+        w.start()
+    time.sleep(seconds)
+    stats = sample()
+    stop.set()
+    for w in workers:
+        w.join()
+    return stats
+
+
+def measure_thread(database_url: str, seconds: float, interval: float, load_threads: int) -> dict:
+    engine = get_engine(database_url, pool_size=1, max_overflow=1)
+    tracker = WindowTracker(get_session_factory(engine), poll_interval_seconds=interval)
+    tracker.start()
+    try:
+        return _with_load(load_threads, seconds, tracker.tick_stats)
+    finally:
+        tracker.stop()
+        engine.dispose()
+
+
+def measure_process(database_url: str, seconds: float, interval: float, load_threads: int) -> dict:
+    tracker = TrackerProcess(database_url, {"pool_size": 1, "max_overflow": 1}, poll_interval_seconds=interval)
+    tracker.start()
+    try:
+        time.sleep(2.0)  # let the child start up before loading the parent
+        return _with_load(load_threads, seconds, tracker.tick_stats)
+    finally:
+        tracker.close()
+
+
+def _print(label: str, stats: dict) -> None:
+    print(
+        f"{label:<10} ticks={stats.get('ticks', 0):<6} "
+        f"p50={stats.get('p50_jitter_ms', 0):>8.2f} ms  "
+        f"p99={stats.get('p99_jitter_ms', 0):>8.2f} ms  "
+        f"max={stats.get('max_jitter_ms', 0):>8.2f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare tracker tick jitter: thread vs isolated process.")
+    parser.add_argument("--seconds", type=float, default=20.0, help="Load duration per mode")
+    parser.add_argument("--interval", type=float, default=0.05, help="Tracker poll interval in seconds")
+    parser.add_argument("--load-threads", type=int, default=4, help="CPU-bound threads in the main process")
+    args = parser.parse_args()
+
+    database_url = os.getenv("DATABASE_URL")
+    if not database_url:
+        print("ERROR: Set DATABASE_URL in .env")
+        sys.exit(1)
+
+    print(f"Poll interval {args.interval * 1000:.0f} ms, {args.load_threads} load threads, {args.seconds:.0f} s per mode")
+    _print("thread", measure_thread(database_url, args.seconds, args.interval, args.load_threads))
+    _print("process", measure_process(database_url, args.seconds, args.interval, args.load_threads))
+
+
+if __name__ == "__main__":
+    main()
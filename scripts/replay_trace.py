@@ -0,0 +1,127 @@
+"""
+Record, synthesize and replay foreground-window traces against the database.
+Replays run the real WindowTracker with a simulated clock, far faster than real time, and write
+sessions dated at the simulation epoch (year 2000); they are deleted afterwards unless --keep is given.
+
+Usage:
+  python -m scripts.replay_trace record trace.ndjson --seconds 3600      (Windows only)
+  python -m scripts.replay_trace synth trace.ndjson --hours 9 --seed 1
+  python -m scripts.replay_trace replay --trace trace.ndjson
+  python -m scripts.replay_trace replay --synthetic-hours 10 --days 5
+"""
+import argparse
+import json
+import os
+import sys
+from datetime import timedelta
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from dotenv import load_dotenv
+
+load_dotenv(Path(__file__).resolve().parent.parent / ".env")
+
+from tracker.simulator import (
+    SIMULATION_EPOCH,
+    read_trace,
+    record_trace,
+    replay_trace,
+    synthesize_workday,
+    write_trace,
+)
+
+
+def _print_result(label: str, result: dict) -> None:
+    lat = result["write_latency"]
+    print(
+        f"{label}: {result['simulated_seconds'] / 3600:.1f} h simulated in {result['wall_seconds']:.2f} s "
+        f"({result['speedup']}x), {result['trace_events']} events, {result['rows_written']} rows written"
+    )
+    print(
+        f"  write latency p50={lat['p50_ms']} ms p90={lat['p90_ms']} ms "
+        f"p99={lat['p99_ms']} ms max={lat['max_ms']} ms"
+    )
+    print(
+        f"  accuracy: {result['abs_error_seconds']} s absolute error ({result['abs_error_pct']}%), "
+        f"in-memory aggregate matches DB: {result['memory_matches_db']}"
+    )
+    for app in result["apps"][:10]:
+        print(
+            f"    {app['process_name']:<24} trace={app['trace_seconds']:>9} s  "
+            f"db={app['db_seconds']:>9} s  error={app['error_seconds']:>7} s"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Record and replay tracker traces.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    rec = sub.add_parser("record", help="Record the real foreground window (Windows only)")
+    rec.add_argument("path", type=Path)
+    rec.add_argument("--seconds", type=float, default=3600.0)
+    rec.add_argument("--sample-interval", type=float, default=0.5)
+
+    syn = sub.add_parser("synth", help="Write a synthetic workday trace")
+    syn.add_argument("path", type=Path)
+    syn.add_argument("--hours", type=float, default=9.0)
+    syn.add_argument("--seed", type=int, default=0)
+
+    rep = sub.add_parser("replay", help="Replay a trace through the tracker against DATABASE_URL")
+    source = rep.add_mutually_exclusive_group(required=True)
+    source.add_argument("--trace", type=Path)
+    source.add_argument("--synthetic-hours", type=float)
+    rep.add_argument("--days", type=int, default=1, help="Synthetic workdays to replay (one per simulated day)")
+    rep.add_argument("--seed", type=int, default=0)
+    rep.add_argument("--poll", type=float, default=5.0, help="Tracker poll interval in seconds")
+    rep.add_argument("--keep", action="store_true", help="Keep replayed rows in the database")
+    rep.add_argument("--json", action="store_true", help="Print raw results as JSON")
+    args = parser.parse_args()
+
+    if args.command == "record":
+        count = record_trace(args.path, args.seconds, args.sample_interval)
+        print(f"Recorded {count} events to {args.path}")
+        return
+    if args.command == "synth":
+        events, duration = synthesize_workday(args.hours, args.seed)
+        write_trace(args.path, events, duration)
+        print(f"Wrote {len(events)} events ({args.hours} h) to {args.path}")
+        return
+
+    database_url = os.getenv("DATABASE_URL")
+    if not database_url:
+        print("ERROR: Set DATABASE_URL in .env")
+        sys.exit(1)
+
+    from db.session import get_engine, get_session_factory, init_db
+
+    engine = get_engine(database_url)
+    init_db(engine)
+    session_factory = get_session_factory(engine)
+
+    if args.trace:
+        runs = [(str(args.trace), *read_trace(args.trace))]
+    else:
+        runs = [
+            (f"day {d + 1}", *synthesize_workday(args.synthetic_hours, args.seed + d))
+            for d in range(args.days)
+        ]
+    for d, (label, events, duration) in enumerate(runs):
+        result = replay_trace(
+            events,
+            duration,
+            session_factory,
+            poll_interval_seconds=args.poll,
+            start=SIMULATION_EPOCH + timedelta(days=d),
+            cleanup=not args.keep,
+        )
+        if args.json:
+            print(json.dumps({"label": label, **result}))
+        else:
+            _print_result(label, result)
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
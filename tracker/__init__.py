@@ -1,3 +1,4 @@
-from .window_tracker import WindowTracker
+from .window_tracker import TickStats, TodayAggregate, WindowTracker
+from .worker import TrackerProcess
 
-__all__ = ["WindowTracker"]
+__all__ = ["TickStats", "TodayAggregate", "TrackerProcess", "WindowTracker"]
@@ -0,0 +1,258 @@
+"""
+Record and replay foreground-window traces so the tracker can be exercised without a Windows desktop.
+
+Trace format (NDJSON): one event per line, written whenever the foreground window changes:
+    {"t": 12.5, "process_name": "Code.exe", "window_title": "main.py"}
+t is seconds since the start of the trace; process_name null means no foreground window.
+The last line may be {"t": <end>, "end": true} to mark the trace duration.
+"""
+import json
+import random
+import time
+from bisect import bisect_right
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from sqlalchemy import func
+
+from .window_tracker import WindowTracker, _get_foreground_window_info
+
+# Replayed sessions are placed far from real data so they can be identified and removed.
+SIMULATION_EPOCH = datetime(2000, 1, 3, 8, 0, tzinfo=timezone.utc)
+
+TraceEvent = tuple[float, Optional[tuple[str, str]]]
+
+
+def read_trace(path: Path) -> tuple[list[TraceEvent], float]:
+    """Returns (events sorted by t, duration in seconds)."""
+    events: list[TraceEvent] = []
+    duration = 0.0
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            record = json.loads(line)
+            t = float(record["t"])
+            duration = max(duration, t)
+            if record.get("end"):
+                continue
+            process_name = record.get("process_name")
+            window = (process_name, record.get("window_title") or "") if process_name else None
+            events.append((t, window))
+    events.sort(key=lambda e: e[0])
+    return events, duration
+
+
+def write_trace(path: Path, events: Iterable[TraceEvent], duration: float) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        for t, window in events:
+            record = {"t": round(t, 3), "process_name": window[0] if window else None}
+            if window:
+                record["window_title"] = window[1]
+            f.write(json.dumps(record) + "\n")
+        f.write(json.dumps({"t": round(duration, 3), "end": True}) + "\n")
+
+
+def record_trace(
+    path: Path,
+    duration_seconds: float,
+    sample_interval_seconds: float = 0.5,
+    window_info: Callable[[], Optional[tuple[str, str]]] = _get_foreground_window_info,
+) -> int:
+    """Sample the real foreground window and write change events to path. Returns the number of events."""
+    started = time.monotonic()
+    last: Any = object()
+    count = 0
+    with open(path, "w", encoding="utf-8") as f:
+        while True:
+            t = time.monotonic() - started
+            if t >= duration_seconds:
+                break
+            window = window_info()
+            if window != last:
+                record = {"t": round(t, 3), "process_name": window[0] if window else None}
+                if window:
+                    record["window_title"] = window[1]
+                f.write(json.dumps(record) + "\n")
+                f.flush()
+                last = window
+                count += 1
+            time.sleep(sample_interval_seconds)
+        f.write(json.dumps({"t": round(duration_seconds, 3), "end": True}) + "\n")
+    return count
+
+
+def synthesize_workday(hours: float = 9.0, seed: int = 0) -> tuple[list[TraceEvent], float]:
+    """A synthetic workday: a few focus apps with long dwell times and frequent short switches."""
+    rng = random.Random(seed)
+    apps = [
+        ("Code.exe", ["main.py - project", "tracker.py - project", "README.md - project"], 0.30, 600),
+        ("chrome.exe", ["Pull request #42", "Docs - SQLAlchemy", "Stack Overflow"], 0.25, 120),
+        ("slack.exe", ["#team", "Direct message"], 0.15, 45),
+        ("Teams.exe", ["Daily standup", "Design review"], 0.05, 1200),
+        ("WindowsTerminal.exe", ["pytest", "psql"], 0.15, 90),
+        ("explorer.exe", ["Downloads"], 0.05, 15),
+        ("OUTLOOK.EXE", ["Inbox"], 0.05, 60),
+    ]
+    weights = [a[2] for a in apps]
+    duration = hours * 3600.0
+    events: list[TraceEvent] = []
+    t = 0.0
+    while t < duration:
+        process_name, titles, _, mean_dwell = rng.choices(apps, weights=weights)[0]
+        events.append((t, (process_name, rng.choice(titles))))
+        t += max(1.0, rng.expovariate(1.0 / mean_dwell))
+    return events, duration
+
+
+class SimulatedClock:
+    """Clock that only moves when advanced; pass clock.now to WindowTracker."""
+
+    def __init__(self, start: datetime):
+        self._now = start
+
+    def now(self) -> datetime:
+        return self._now
+
+    def set(self, value: datetime) -> None:
+        self._now = value
+
+
+class _TracePlayer:
+    """window_info provider answering 'what is in the foreground at the simulated time'."""
+
+    def __init__(self, events: list[TraceEvent], clock: SimulatedClock, start: datetime):
+        self._times = [e[0] for e in events]
+        self._windows = [e[1] for e in events]
+        self._clock = clock
+        self._start = start
+
+    def __call__(self) -> Optional[tuple[str, str]]:
+        t = (self._clock.now() - self._start).total_seconds()
+        i = bisect_right(self._times, t) - 1
+        return self._windows[i] if i >= 0 else None
+
+
+def _trace_totals(events: list[TraceEvent], duration: float) -> dict[str, float]:
+    """Ground truth: exact seconds per process from the trace (no-window periods excluded)."""
+    totals: dict[str, float] = {}
+    for i, (t, window) in enumerate(events):
+        end = events[i + 1][0] if i + 1 < len(events) else duration
+        if window and end > t:
+            totals[window[0]] = totals.get(window[0], 0.0) + (min(end, duration) - t)
+    return totals
+
+
+def _percentiles(values: list[float]) -> dict[str, float]:
+    if not values:
+        return {"p50_ms": 0.0, "p90_ms": 0.0, "p99_ms": 0.0, "max_ms": 0.0}
+    ordered = sorted(values)
+
+    def pct(q: float) -> float:
+        return round(1000 * ordered[int(q * (len(ordered) - 1))], 3)
+
+    return {"p50_ms": pct(0.50), "p90_ms": pct(0.90), "p99_ms": pct(0.99), "max_ms": round(1000 * ordered[-1], 3)}
+
+
+def _iter_ticks(start: datetime, duration: float, poll_interval: float) -> Iterator[datetime]:
+    n = int(duration // poll_interval)
+    for k in range(1, n + 1):
+        yield start + timedelta(seconds=k * poll_interval)
+
+
+def replay_trace(
+    events: list[TraceEvent],
+    duration: float,
+    session_factory: Callable,
+    poll_interval_seconds: float = 5.0,
+    start: datetime = SIMULATION_EPOCH,
+    cleanup: bool = True,
+) -> dict[str, Any]:
+    """
+    Drive a WindowTracker through the trace with a simulated clock against a real database.
+    Returns rows written, write latency percentiles, accuracy against the trace and the replay speed-up.
+    Only rows written by this replay are measured and cleaned up; rows kept from earlier replays of
+    the same range are left alone.
+    """
+    from db.models import WindowSession
+
+    clock = SimulatedClock(start)
+    tracker = WindowTracker(
+        session_factory=session_factory,
+        poll_interval_seconds=poll_interval_seconds,
+        timezone_str="UTC",
+        window_info=_TracePlayer(events, clock, start),
+        clock=clock.now,
+    )
+    end = start + timedelta(seconds=duration)
+    with session_factory() as session:
+        last_id_before = session.query(func.max(WindowSession.id)).scalar() or 0
+
+    latencies: list[float] = []
+    persist = tracker._persist_session
+
+    def timed_persist(*args, **kwargs) -> None:
+        t0 = time.perf_counter()
+        persist(*args, **kwargs)
+        latencies.append(time.perf_counter() - t0)
+
+    tracker._persist_session = timed_persist  # type: ignore[method-assign]
+
+    wall_started = time.perf_counter()
+    for now in _iter_ticks(start, duration, poll_interval_seconds):
+        clock.set(now)
+        tracker._tick(now)
+    clock.set(end)
+    tracker._end_current_session(end)
+    wall_seconds = time.perf_counter() - wall_started
+    in_memory = {p["process_name"]: p["seconds"] for p in tracker.today_snapshot()["processes"]}
+
+    in_range = (
+        WindowSession.started_at >= start,
+        WindowSession.started_at < end,
+        WindowSession.id > last_id_before,
+    )
+    with session_factory() as session:
+        rows = (
+            session.query(WindowSession.process_name, func.count(), func.sum(WindowSession.duration_seconds))
+            .where(*in_range)
+            .group_by(WindowSession.process_name)
+            .all()
+        )
+        if cleanup:
+            session.query(WindowSession).where(*in_range).delete(synchronize_session=False)
+            session.commit()
+
+    stored = {r[0]: float(r[2] or 0) for r in rows}
+    truth = _trace_totals(events, duration)
+    apps = sorted(set(truth) | set(stored), key=lambda p: truth.get(p, 0.0), reverse=True)
+    per_app = [
+        {
+            "process_name": p,
+            "trace_seconds": round(truth.get(p, 0.0), 1),
+            "db_seconds": round(stored.get(p, 0.0), 1),
+            "memory_seconds": round(in_memory.get(p, 0.0), 1),
+            "error_seconds": round(stored.get(p, 0.0) - truth.get(p, 0.0), 1),
+        }
+        for p in apps
+    ]
+    abs_error = sum(abs(a["error_seconds"]) for a in per_app)
+    return {
+        "simulated_seconds": duration,
+        "wall_seconds": round(wall_seconds, 3),
+        "speedup": round(duration / wall_seconds, 1) if wall_seconds else None,
+        "trace_events": len(events),
+        "rows_written": sum(int(r[1]) for r in rows),
+        "write_latency": _percentiles(latencies),
+        "abs_error_seconds": round(abs_error, 1),
+        "abs_error_pct": round(100 * abs_error / sum(truth.values()), 3) if truth else 0.0,
+        # The in-memory aggregate only covers the last local day, so compare it for single-day traces only
+        "memory_matches_db": (
+            all(abs(a["db_seconds"] - a["memory_seconds"]) < 0.5 for a in per_app)
+            if start.date() == end.date()
+            else None
+        ),
+        "apps": per_app,
+    }
@@ -2,14 +2,23 @@
 Real-time tracker of the active Windows foreground window.
 Records process name and window title; computes exact duration per session.
 """
+import logging
 import threading
 import time
-from datetime import datetime, timezone
-from typing import Callable, Optional
+from collections import deque
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Callable, Optional
+from zoneinfo import ZoneInfo
 
 import psutil
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
+logger = logging.getLogger(__name__)
+
+# Seeding today's totals from the database is retried at most this often after a failure
+SEED_RETRY_SECONDS = 60.0
+
 # Windows-only
 try:
     import win32gui
@@ -38,25 +47,168 @@ def _get_foreground_window_info() -> Optional[tuple[str, str]]:
         return None
 
 
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class TickStats:
+    """Recent poll-loop jitter: how late each tick woke up relative to its scheduled time."""
+
+    def __init__(self, window: int = 2000):
+        self._lock = threading.Lock()
+        self._recent = deque(maxlen=window)
+        self.ticks = 0
+
+    def record(self, jitter_seconds: float) -> None:
+        with self._lock:
+            self.ticks += 1
+            self._recent.append(jitter_seconds)
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            recent = sorted(self._recent)
+            ticks = self.ticks
+
+        def pct(q: float) -> float:
+            return round(1000 * recent[int(q * (len(recent) - 1))], 3) if recent else 0.0
+
+        return {
+            "ticks": ticks,
+            "p50_jitter_ms": pct(0.50),
+            "p99_jitter_ms": pct(0.99),
+            "max_jitter_ms": round(1000 * recent[-1], 3) if recent else 0.0,
+        }
+
+
+class TodayAggregate:
+    """
+    Running per-process and per-(process, title) seconds for the current local day.
+    Sessions are clipped to local midnight; totals reset when the local date changes.
+    The top max_titles titles are kept up to date as sessions close (totals only grow during a day,
+    so a title can only enter the top when it is added to), and snapshots cost O(processes + max_titles).
+    Not thread-safe on its own; WindowTracker guards it with its lock.
+    """
+
+    def __init__(self, tz: ZoneInfo, max_titles: int = 50):
+        self._tz = tz
+        self._max_titles = max_titles
+        self.day: Optional[date] = None
+        self._day_start: Optional[datetime] = None
+        self._day_end: Optional[datetime] = None
+        self._by_process: dict[str, float] = {}
+        self._by_title: dict[tuple[str, str], float] = {}
+        self._top_titles: dict[tuple[str, str], float] = {}
+
+    def bounds(self, now: datetime) -> tuple[datetime, datetime]:
+        """Roll over if now is on a new local day; return (day_start, day_end) for the current day."""
+        local_day = now.astimezone(self._tz).date()
+        if local_day != self.day:
+            self.day = local_day
+            self._day_start = datetime.combine(local_day, datetime.min.time(), tzinfo=self._tz)
+            self._day_end = datetime.combine(local_day + timedelta(days=1), datetime.min.time(), tzinfo=self._tz)
+            self.clear()
+        return self._day_start, self._day_end
+
+    def clear(self) -> None:
+        """Drop the current day's totals (the day itself is kept)."""
+        self._by_process = {}
+        self._by_title = {}
+        self._top_titles = {}
+
+    def _clipped_seconds(self, started_at: datetime, ended_at: datetime) -> float:
+        start = max(started_at, self._day_start)
+        end = min(ended_at, self._day_end)
+        return max((end - start).total_seconds(), 0.0)
+
+    def add_seconds(self, process_name: str, window_title: str, seconds: float) -> None:
+        if seconds <= 0:
+            return
+        self._by_process[process_name] = self._by_process.get(process_name, 0.0) + seconds
+        key = (process_name, window_title)
+        total = self._by_title.get(key, 0.0) + seconds
+        self._by_title[key] = total
+        self._offer_top(self._top_titles, key, total)
+
+    def _offer_top(self, top: dict[tuple[str, str], float], key: tuple[str, str], total: float) -> None:
+        """Put key into top if it is already there, top has room, or total beats top's smallest entry."""
+        if key in top or len(top) < self._max_titles:
+            top[key] = total
+            return
+        smallest = min(top, key=top.get)
+        if total > top[smallest]:
+            del top[smallest]
+            top[key] = total
+
+    def add(self, process_name: str, window_title: str, started_at: datetime, ended_at: datetime) -> None:
+        self.bounds(ended_at)
+        self.add_seconds(process_name, window_title, self._clipped_seconds(started_at, ended_at))
+
+    def snapshot(
+        self,
+        now: datetime,
+        current: Optional[tuple[str, str, datetime]] = None,
+    ) -> dict[str, Any]:
+        """Totals for today including the open session's elapsed time (current = (process, title, started_at))."""
+        self.bounds(now)
+        by_process = dict(self._by_process)
+        top_titles = dict(self._top_titles)
+        current_info = None
+        if current is not None:
+            process_name, window_title, started_at = current
+            elapsed = self._clipped_seconds(started_at, now)
+            by_process[process_name] = by_process.get(process_name, 0.0) + elapsed
+            key = (process_name, window_title)
+            self._offer_top(top_titles, key, self._by_title.get(key, 0.0) + elapsed)
+            current_info = {
+                "process_name": process_name,
+                "window_title": window_title,
+                "started_at": started_at.isoformat(),
+                "elapsed_seconds": round(elapsed, 1),
+            }
+        processes = sorted(by_process.items(), key=lambda kv: kv[1], reverse=True)
+        titles = sorted(top_titles.items(), key=lambda kv: kv[1], reverse=True)
+        return {
+            "date": self.day.isoformat(),
+            "total_seconds": round(sum(by_process.values()), 1),
+            "processes": [{"process_name": p, "seconds": round(sec, 1)} for p, sec in processes],
+            "titles": [
+                {"process_name": p, "window_title": t, "seconds": round(sec, 1)} for (p, t), sec in titles
+            ],
+            "current": current_info,
+        }
+
+
 class WindowTracker:
     """
     Runs in a background thread; polls foreground window at interval.
     On change, closes previous session (sets ended_at, duration_seconds) and starts new one.
+    Keeps a live in-memory aggregate for the current local day (see today_snapshot).
+    window_info and clock can be replaced to drive the tracker from a recorded or synthetic trace.
     """
 
     def __init__(
         self,
         session_factory: Callable[[], Session],
         poll_interval_seconds: float = 5.0,
+        timezone_str: str = "UTC",
+        window_info: Callable[[], Optional[tuple[str, str]]] = _get_foreground_window_info,
+        clock: Callable[[], datetime] = _utc_now,
     ):
         self._session_factory = session_factory
         self._poll_interval = poll_interval_seconds
+        self._window_info = window_info
+        self._clock = clock
         self._thread: Optional[threading.Thread] = None
         self._stop = threading.Event()
+        self._lock = threading.Lock()
         self._current_process: Optional[str] = None
         self._current_title: Optional[str] = None
         self._current_started_at: Optional[datetime] = None
         self._running = False
+        self._today = TodayAggregate(ZoneInfo(timezone_str))
+        self._today_seeded = False
+        self._seed_retry_at = 0.0
+        self._tick_stats = TickStats()
 
     def _persist_session(
         self,
@@ -79,32 +231,87 @@ class WindowTracker:
             session.add(row)
             session.commit()
 
+    def _seed_today(self) -> None:
+        """
+        Replace today's in-memory totals with the sessions stored for the current local day.
+        Sessions closed before a successful seed were persisted, so they are counted once, from the database.
+        """
+        from db.models import SESSION_LOOKBACK, WindowSession
+
+        with self._lock:
+            day_start, day_end = self._today.bounds(self._clock())
+        seconds = func.extract(
+            "epoch",
+            func.least(WindowSession.ended_at, day_end) - func.greatest(WindowSession.started_at, day_start),
+        )
+        with self._session_factory() as session:
+            rows = (
+                session.query(WindowSession.process_name, WindowSession.window_title, func.sum(seconds))
+                .where(
+                    WindowSession.started_at >= day_start - SESSION_LOOKBACK,
+                    WindowSession.started_at < day_end,
+                    WindowSession.ended_at > day_start,
+                )
+                .group_by(WindowSession.process_name, WindowSession.window_title)
+                .all()
+            )
+        with self._lock:
+            if self._today.day == day_start.date():
+                self._today.clear()
+                for process_name, window_title, total in rows:
+                    self._today.add_seconds(process_name, window_title or "", float(total or 0))
+
+    def _try_seed_today(self) -> None:
+        """Seed today's totals once per process; after a failure, retry from the poll loop."""
+        if self._today_seeded or time.monotonic() < self._seed_retry_at:
+            return
+        try:
+            self._seed_today()
+        except Exception:
+            self._seed_retry_at = time.monotonic() + SEED_RETRY_SECONDS
+            logger.warning(
+                "Could not load today's stored sessions; retrying in %.0f s", SEED_RETRY_SECONDS, exc_info=True
+            )
+            return
+        self._today_seeded = True
+
+    def _end_current_session(self, now: datetime) -> None:
+        """Close the open session: add it to today's aggregate and persist it."""
+        with self._lock:
+            if self._current_process is None or self._current_started_at is None:
+                return
+            process_name = self._current_process
+            window_title = self._current_title or ""
+            started_at = self._current_started_at
+            self._current_process = None
+            self._current_title = None
+            self._current_started_at = None
+            self._today.add(process_name, window_title, started_at, now)
+        self._persist_session(process_name, window_title, started_at, now)
+
     def _tick(self, now: datetime) -> None:
-        info = _get_foreground_window_info()
+        info = self._window_info()
         if info is None:
             return
         process_name, window_title = info
 
-        if self._current_process is not None and (
-            self._current_process != process_name or self._current_title != window_title
-        ):
-            # Window changed: end previous session
-            self._persist_session(
-                self._current_process,
-                self._current_title or "",
-                self._current_started_at,
-                now,
-            )
-
-        # Start or continue current session
-        if self._current_process != process_name or self._current_title != window_title:
+        if self._current_process == process_name and self._current_title == window_title:
+            return
+        # Window changed: end previous session, start new one
+        self._end_current_session(now)
+        with self._lock:
             self._current_process = process_name
             self._current_title = window_title
             self._current_started_at = now
 
     def _run_loop(self) -> None:
-        while not self._stop.wait(timeout=self._poll_interval):
-            now = datetime.now(timezone.utc)
+        while True:
+            scheduled = time.monotonic() + self._poll_interval
+            if self._stop.wait(timeout=self._poll_interval):
+                break
+            self._tick_stats.record(max(time.monotonic() - scheduled, 0.0))
+            self._try_seed_today()
+            now = self._clock()
             try:
                 self._tick(now)
             except Exception:
@@ -112,20 +319,16 @@ class WindowTracker:
                 pass
 
         # On stop: close current session if any
-        if self._current_process is not None and self._current_started_at is not None:
-            try:
-                self._persist_session(
-                    self._current_process,
-                    self._current_title or "",
-                    self._current_started_at,
-                    datetime.now(timezone.utc),
-                )
-            except Exception:
-                pass
+        try:
+            self._end_current_session(self._clock())
+        except Exception:
+            pass
 
     def start(self) -> None:
         if self._running:
             return
+        self._seed_retry_at = 0.0  # a fresh start always tries seeding right away
+        self._try_seed_today()
         self._running = True
         self._stop.clear()
         self._thread = threading.Thread(target=self._run_loop, daemon=True)
@@ -143,3 +346,16 @@ class WindowTracker:
     @property
     def is_running(self) -> bool:
         return self._running
+
+    def today_snapshot(self) -> dict[str, Any]:
+        """Today's totals per process and per window title, served from memory."""
+        now = self._clock()
+        with self._lock:
+            current = None
+            if self._current_process is not None and self._current_started_at is not None:
+                current = (self._current_process, self._current_title or "", self._current_started_at)
+            return self._today.snapshot(now, current)
+
+    def tick_stats(self) -> dict[str, Any]:
+        """Poll-loop jitter percentiles over recent ticks."""
+        return self._tick_stats.snapshot()
@@ -0,0 +1,246 @@
+"""
+Run WindowTracker in a dedicated child process so report generation, the web UI and the GIL
+cannot delay tracker ticks, and a crash elsewhere does not stop tracking.
+The main process controls the child over a pipe (start/stop/status/shutdown) and receives
+periodic state updates over a queue. A supervisor thread restarts the child if it dies.
+"""
+import itertools
+import multiprocessing
+import queue
+import threading
+import time
+from typing import Any, Optional
+
+from .window_tracker import WindowTracker
+
+STATUS_INTERVAL_SECONDS = 1.0
+MAX_RESTART_BACKOFF_SECONDS = 30.0
+
+
+def _status(tracker: WindowTracker, version: tuple[int, int]) -> dict[str, Any]:
+    return {
+        "version": version,
+        "running": tracker.is_running,
+        "today": tracker.today_snapshot(),
+        "ticks": tracker.tick_stats(),
+    }
+
+
+def _child_main(
+    conn,
+    state_queue,
+    database_url: str,
+    engine_options: dict[str, Any],
+    poll_interval_seconds: float,
+    timezone_str: str,
+    start_tracking: bool,
+    generation: int,
+) -> None:
+    """
+    Child process entry point: own engine, own tracker, serve commands until shutdown.
+    Every status (command reply or periodic update) is stamped with (generation, sequence number)
+    so the parent can tell which of two statuses is newer.
+    """
+    from db.session import get_engine, get_session_factory
+
+    engine = get_engine(database_url, **engine_options)
+    tracker = WindowTracker(
+        session_factory=get_session_factory(engine),
+        poll_interval_seconds=poll_interval_seconds,
+        timezone_str=timezone_str,
+    )
+    if start_tracking:
+        tracker.start()
+    sequence = itertools.count()
+
+    def status() -> dict[str, Any]:
+        return _status(tracker, (generation, next(sequence)))
+
+    try:
+        while True:
+            if conn.poll(STATUS_INTERVAL_SECONDS):
+                try:
+                    command_id, command = conn.recv()
+                except EOFError:
+                    break  # parent went away
+                if command == "start":
+                    tracker.start()
+                elif command == "stop":
+                    tracker.stop()
+                elif command == "shutdown":
+                    conn.send((command_id, status()))
+                    break
+                conn.send((command_id, status()))
+            try:
+                state_queue.put_nowait(status())
+            except queue.Full:
+                pass
+    finally:
+        tracker.stop()
+        engine.dispose()
+
+
+class TrackerProcess:
+    """
+    Supervisor for a WindowTracker running in a child process.
+    Same control surface as WindowTracker (start, stop, is_running, today_snapshot, tick_stats);
+    reads are served from the newest status received, so they never block on the child.
+    is_running reports whether the child is actually tracking (False while it is down or starting).
+    """
+
+    def __init__(
+        self,
+        database_url: str,
+        engine_options: Optional[dict[str, Any]] = None,
+        poll_interval_seconds: float = 5.0,
+        timezone_str: str = "UTC",
+        command_timeout_seconds: float = 10.0,
+    ):
+        self._database_url = database_url
+        self._engine_options = engine_options or {}
+        self._poll_interval = poll_interval_seconds
+        self._timezone_str = timezone_str
+        self._command_timeout = command_timeout_seconds
+        # spawn on every platform: Windows only supports it, and forking a threaded process is unsafe
+        self._ctx = multiprocessing.get_context("spawn")
+        self._lock = threading.Lock()
+        self._process = None
+        self._conn = None
+        self._command_ids = itertools.count()
+        self._state_queue = None
+        self._generation = 0
+        self._state: dict[str, Any] = {"version": (0, -1), "running": False, "today": None, "ticks": None}
+        self._state_lock = threading.Lock()
+        self._want_running = False
+        self._closed = threading.Event()
+        self._supervisor: Optional[threading.Thread] = None
+        self.restarts = 0
+
+    # --- child lifecycle ---
+
+    def _spawn(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+        self._generation += 1
+        # Until the new child reports, it is not tracking; today's totals are kept from the last status
+        self._set_state({**self._state, "version": (self._generation, -1), "running": False})
+        parent_conn, child_conn = self._ctx.Pipe()
+        self._state_queue = self._ctx.Queue(maxsize=8)
+        self._process = self._ctx.Process(
+            target=_child_main,
+            args=(
+                child_conn,
+                self._state_queue,
+                self._database_url,
+                self._engine_options,
+                self._poll_interval,
+                self._timezone_str,
+                self._want_running,
+                self._generation,
+            ),
+            name="window-tracker",
+            daemon=True,
+        )
+        self._process.start()
+        child_conn.close()
+        self._conn = parent_conn
+
+    def _set_state(self, state: dict[str, Any]) -> None:
+        """Apply a status unless a newer one was already applied (the queue may still hold older ones)."""
+        with self._state_lock:
+            if state["version"] >= self._state["version"]:
+                self._state = state
+
+    def _supervise(self) -> None:
+        backoff = 1.0
+        while not self._closed.is_set():
+            with self._lock:
+                process, state_queue = self._process, self._state_queue
+            if process is not None and not process.is_alive():
+                if self._closed.wait(backoff):
+                    break
+                with self._lock:
+                    if self._closed.is_set():
+                        break
+                    self._spawn()
+                    self.restarts += 1
+                backoff = min(backoff * 2, MAX_RESTART_BACKOFF_SECONDS)
+                continue
+            try:
+                state = state_queue.get(timeout=STATUS_INTERVAL_SECONDS)
+            except (queue.Empty, OSError, EOFError):
+                continue
+            self._set_state(state)
+            backoff = 1.0
+
+    def _ensure_started(self) -> None:
+        if self._supervisor is not None:
+            return
+        with self._lock:
+            self._spawn()
+        self._supervisor = threading.Thread(target=self._supervise, name="tracker-supervisor", daemon=True)
+        self._supervisor.start()
+
+    def _command(self, command: str) -> None:
+        """Send a command and wait for its reply. Replies carry the command id, so a reply that
+        arrives after its command timed out is discarded instead of answering the next command."""
+        with self._lock:
+            command_id = next(self._command_ids)
+            deadline = time.monotonic() + self._command_timeout
+            try:
+                while self._conn.poll(0):
+                    self._conn.recv()  # late replies to earlier commands
+                self._conn.send((command_id, command))
+                while self._conn.poll(max(deadline - time.monotonic(), 0)):
+                    reply_id, state = self._conn.recv()
+                    if reply_id == command_id:
+                        self._set_state(state)
+                        break
+            except (OSError, EOFError):
+                pass  # child died; the supervisor restarts it with the desired state
+
+    # --- WindowTracker-compatible API ---
+
+    def start(self) -> None:
+        self._want_running = True
+        if self._supervisor is None:
+            self._ensure_started()  # child starts tracking on launch
+            return
+        self._command("start")
+
+    def stop(self) -> None:
+        self._want_running = False
+        if self._supervisor is not None:
+            self._command("stop")
+
+    @property
+    def is_running(self) -> bool:
+        return bool(self._process is not None and self._process.is_alive() and self._state.get("running"))
+
+    def today_snapshot(self) -> dict[str, Any]:
+        return self._state.get("today") or {}
+
+    def tick_stats(self) -> dict[str, Any]:
+        return self._state.get("ticks") or {}
+
+    def status(self) -> dict[str, Any]:
+        return {
+            "pid": self._process.pid if self._process is not None else None,
+            "alive": bool(self._process is not None and self._process.is_alive()),
+            "restarts": self.restarts,
+            "running": self.is_running,
+            "wanted": self._want_running,
+            "ticks": self.tick_stats(),
+        }
+
+    def close(self, timeout: float = 10.0) -> None:
+        """Stop tracking, shut the child down (closing its open session) and stop supervising."""
+        self._closed.set()
+        self._want_running = False
+        if self._supervisor is None:
+            return
+        self._command("shutdown")
+        self._process.join(timeout)
+        if self._process.is_alive():
+            self._process.terminate()
+        self._supervisor.join(timeout)
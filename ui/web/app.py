@@ -3,10 +3,13 @@ Flask web UI: dashboard, settings, past reports, activity.
 """
 from datetime import date, datetime
 from typing import Any, Callable, Optional
+from zoneinfo import ZoneInfo
 
 from flask import Flask, redirect, render_template, request, url_for
 
 from db.models import DailyReport, WindowSession
+from report.focus import get_focus_stats
+from report.timeline import BUCKET_MINUTES, get_day_timeline, get_year_heatmap
 
 
 def create_app(
@@ -15,6 +18,8 @@ def create_app(
     tracker_is_running: Callable[[], bool],
     toggle_tracking: Callable[[], None],
     run_report_now: Optional[Callable[[], tuple[bool, str]]] = None,
+    pool_stats: Optional[Callable[[], dict]] = None,
+    today_snapshot: Optional[Callable[[], dict]] = None,
 ) -> Flask:
     app = Flask(__name__, template_folder="templates", static_folder="static")
     app.secret_key = settings.flask_secret_key
@@ -24,6 +29,10 @@ def create_app(
     def get_session():
         return session_factory()
 
+    def local_today() -> date:
+        # Reports bucket days in settings.timezone, which may differ from the host's time zone
+        return datetime.now(ZoneInfo(settings.timezone)).date()
+
     # --- Dashboard ---
     @app.route("/")
     def index():
@@ -116,6 +125,55 @@ def create_app(
             "last_sent_at": last.sent_at.isoformat() if last and last.sent_at else None,
         }
 
+    @app.route("/api/timeline")
+    def api_timeline():
+        date_str = request.args.get("date")
+        try:
+            target_date = date.fromisoformat(date_str) if date_str else local_today()
+        except ValueError:
+            return {"ok": False, "message": "Invalid date"}, 400
+        bucket = request.args.get("bucket", 15, type=int)
+        if bucket not in BUCKET_MINUTES:
+            return {"ok": False, "message": f"bucket must be one of {list(BUCKET_MINUTES)}"}, 400
+        with get_session() as session:
+            return get_day_timeline(session, target_date, settings.timezone, bucket)
+
+    @app.route("/api/heatmap")
+    def api_heatmap():
+        year = request.args.get("year", local_today().year, type=int)
+        if year < 1970 or year > 9999:
+            return {"ok": False, "message": "Invalid year"}, 400
+        with get_session() as session:
+            days = get_year_heatmap(session, year, settings.timezone)
+        return {"year": year, "days": days}
+
+    @app.route("/api/focus")
+    def api_focus():
+        # ?date=YYYY-MM-DD for one day, or ?start=...&end=... for a range (max 366 days)
+        day = request.args.get("date") or local_today().isoformat()
+        try:
+            start = date.fromisoformat(request.args.get("start") or day)
+            end = date.fromisoformat(request.args.get("end") or request.args.get("start") or day)
+        except ValueError:
+            return {"ok": False, "message": "Invalid date"}, 400
+        if end < start or (end - start).days > 366:
+            return {"ok": False, "message": "Invalid date range"}, 400
+        with get_session() as session:
+            return get_focus_stats(session, start, end, settings.timezone)
+
+    @app.route("/api/today")
+    def api_today():
+        # Served from the tracker's in-memory aggregate; no DB queries.
+        if not today_snapshot:
+            return {"ok": False, "message": "Not configured"}, 400
+        return today_snapshot()
+
+    @app.route("/api/pool-stats")
+    def api_pool_stats():
+        if not pool_stats:
+            return {"ok": False, "message": "Not configured"}, 400
+        return pool_stats()
+
     @app.route("/api/tracking", methods=["POST"])
     def api_tracking():
         toggle_tracking()